@@ -3,18 +3,24 @@
 Tag tracks in beets library with CWW genre based on scraped episode tracklists.
 """
 
-import json
+import operator
+import os
 import re
 import sys
 import argparse
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from difflib import get_close_matches
 from pathlib import Path
 from typing import Any
 
+import orjson
 from beets import config
 from beets.library import Library, Item
 from tqdm import tqdm
 
+from normalization import normalize
+
 
 # ----------------------------
 # BEETS VERSION COMPATIBILITY
@@ -31,6 +37,8 @@ def _get_genres(item: Item) -> list[str]:
         return item.genres or []
     else:
         raw = item.genre or ""
+        if not raw:
+            return []
         return [g.strip() for g in raw.split(";") if g.strip()]
 
 
@@ -43,37 +51,54 @@ def _set_genres(item: Item, genres_list: list[str]) -> None:
 
 GENRE_TAG = "CWW"
 
+# GENRE_TAG as a whole entry of a legacy "a; b; c" genre string
+_RE_GENRE_TAG = re.compile(rf"(?:^|;)\s*{re.escape(GENRE_TAG)}\s*(?:;|$)")
+
+
+def _is_tagged(item: Item) -> bool:
+    """Check for GENRE_TAG without building the item's genre list."""
+    if _ITEM_HAS_GENRES:
+        return GENRE_TAG in (item.genres or ())
+    raw = item.genre
+    return bool(raw) and GENRE_TAG in raw and bool(_RE_GENRE_TAG.search(raw))
+
+
 DEFAULT_INPUT_JSON = "episodes.json"
 DEFAULT_CACHE_FILE = "artist_cache.json"
 PREVIEW_FILE = "cww_tag_preview.json"
 
+# Fetches (artist, title) from a scraped track dict in a single C-level call.
+_TRACK_FIELDS = operator.itemgetter("artist", "track")
 
-# ----------------------------
-# NORMALIZATION
-# ----------------------------
-
-def normalize(text: str) -> str:
-    if not text:
-        return ""
-
-    text = text.lower()
-    text = re.sub(r"\(.*?\)", "", text)
-    text = text.replace("&", "and")
-    text = text.replace("/", " ")
-    text = re.sub(r"[^\w\s]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+# Values per IN (...) list; stays below SQLite's historical 999-variable limit
+# even when a chunk is bound twice.
+_SQL_CHUNK = 400
 
-    return text
+# Tag writing is I/O-bound (one file per item), so use more threads than cores.
+WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 def load_artist_cache(path: str) -> dict[str, Any]:
     """Load artist cache from JSON file."""
     if Path(path).exists():
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     return {}
 
 
+def load_episodes(path: str) -> list[dict[str, Any]]:
+    """Load scraped episodes from JSON file."""
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        print(f"Error: Input file not found: {path}", file=sys.stderr)
+        sys.exit(1)
+    except orjson.JSONDecodeError as e:
+        print(f"Error: Invalid JSON in {path}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 def get_canonical_artist(
     artist_raw: str,
     cache: dict[str, Any],
@@ -86,16 +111,13 @@ def get_canonical_artist(
     if not artist_raw or not cache:
         return artist_raw
 
-    # Try exact match first
-    if artist_raw in cache:
-        return cache[artist_raw].get("canonical_name") or cache[artist_raw].get("original") or artist_raw
-
-    # Try normalized
-    normalized = normalize(artist_raw)
-    if normalized in cache:
-        return cache[normalized].get("canonical_name") or cache[normalized].get("original") or artist_raw
-
-    return artist_raw
+    # Try exact match first; only normalize when that misses
+    entry = cache.get(artist_raw)
+    if entry is None:
+        entry = cache.get(normalize(artist_raw))
+    if entry is None:
+        return artist_raw
+    return entry.get("canonical_name") or entry.get("original") or artist_raw
 
 
 # ----------------------------
@@ -133,25 +155,29 @@ def load_library() -> Library:
 # MATCHING
 # ----------------------------
 
-def find_matches(
+def build_targets(
     episodes: list[dict[str, Any]],
-    lib: Library,
     artist_cache: dict[str, Any],
-) -> list[Item]:
-    """Find matching tracks in the beets library."""
-    
-    if artist_cache is None:
-        artist_cache = {}
-    
-    print("  Building target lookup set from scraped tracks...")
-    # target_keys: set of (type, artist_ident, title_norm)
-    # type can be 'mbid' or 'name'
-    target_keys = set()
+) -> tuple[dict[str, set[str]], dict[str, set[str]]]:
+    """
+    Build the scraped-side lookup index.
+
+    Returns (name_map, mbid_map), mapping each normalized artist name and
+    each cached MusicBrainz artist ID to the normalized titles played
+    for it. Library rows are probed by artist first, so titles are only
+    compared for artists that appear on the show.
+    """
+    name_map: dict[str, set[str]] = defaultdict(set)
+    mbid_map: dict[str, set[str]] = defaultdict(set)
     
     for episode in episodes:
         for track in episode.get("tracklist", []):
-            artist_raw = track.get("artist", "").strip()
-            title_raw = track.get("track", "").strip()
+            try:
+                artist_raw, title_raw = _TRACK_FIELDS(track)
+            except KeyError:
+                continue
+            artist_raw = artist_raw.strip()
+            title_raw = title_raw.strip()
             if not artist_raw or not title_raw:
                 continue
                 
@@ -162,7 +188,7 @@ def find_matches(
                 continue
                 
             # 1. Always add the raw scraped name (normalized)
-            target_keys.add(('name', artist_norm, title_norm))
+            name_map[artist_norm].add(title_norm)
             
             # 2. Add cache-based names and MBIDs
             # Check for name in cache (direct or normalized)
@@ -170,66 +196,128 @@ def find_matches(
             if cached:
                 mbid = cached.get("mbid")
                 if mbid:
-                    target_keys.add(('mbid', mbid, title_norm))
+                    mbid_map[mbid].add(title_norm)
                 
                 canonical = cached.get("canonical_name")
                 if canonical:
                     canonical_norm = normalize(canonical)
                     if canonical_norm:
-                        target_keys.add(('name', canonical_norm, title_norm))
+                        name_map[canonical_norm].add(title_norm)
+
+    return dict(name_map), dict(mbid_map)
+
 
-    print(f"  Created {len(target_keys)} matching targets.")
+def _query_candidate_rows(
+    lib: Library,
+    name_map: dict[str, set[str]],
+    mbid_map: dict[str, set[str]],
+) -> list[Any]:
+    """
+    Fetch library rows whose artist, album artist or MBID is in scope.
 
-    matches: list[Item] = []
-    seen_ids: set[int] = set()
+    Only the distinct artist strings are normalized in Python; SQLite then
+    returns just the rows for in-scope raw names and MBIDs. Only the
+    columns used for matching are read; full Item objects are loaded for
+    the (few) matched rows afterwards.
+    """
+    columns = "SELECT id, artist, albumartist, title, mb_artistid FROM items"
+    mbids = list(mbid_map)
+    rows: dict[int, Any] = {}
+
+    with lib.transaction() as tx:
+        names = [
+            row[0]
+            for row in tx.query(
+                "SELECT artist FROM items UNION SELECT albumartist FROM items"
+            )
+            if row[0] and normalize(row[0]) in name_map
+        ]
+
+        for start in range(0, len(names), _SQL_CHUNK):
+            chunk = names[start:start + _SQL_CHUNK]
+            marks = ", ".join("?" * len(chunk))
+            for row in tx.query(
+                f"{columns} WHERE artist IN ({marks}) OR albumartist IN ({marks})",
+                chunk + chunk,
+            ):
+                rows[row["id"]] = row
+
+        for start in range(0, len(mbids), _SQL_CHUNK):
+            chunk = mbids[start:start + _SQL_CHUNK]
+            marks = ", ".join("?" * len(chunk))
+            for row in tx.query(f"{columns} WHERE mb_artistid IN ({marks})", chunk):
+                rows[row["id"]] = row
+
+    return [rows[item_id] for item_id in sorted(rows)]
+
+
+def find_matches(
+    name_map: dict[str, set[str]],
+    mbid_map: dict[str, set[str]],
+    lib: Library,
+    fuzzy_score: int = 0,
+) -> list[Item]:
+    """
+    Find library tracks matching the targets from build_targets().
+
+    If fuzzy_score (0-100) is set, library tracks by an in-scope artist
+    whose title has no exact match are compared against that artist's
+    scraped titles and accepted at or above that similarity.
+    """
+    fuzzy_cutoff = fuzzy_score / 100
+
+    # Each library row is visited exactly once, so ids need no de-duplication.
+    matched_ids: list[int] = []
     mbid_matches = 0
     name_matches = 0
+    fuzzy_matches = 0
     
     print("  Iterating through beets library...")
-    # Get total count for progress bar
-    total_items = len(lib.items())
+    rows = _query_candidate_rows(lib, name_map, mbid_map)
     
-    for item in tqdm(lib.items(), total=total_items, unit="item"):
-        # Beets items have attributes like 'artist', 'title', 'mb_artistid'
-        title_norm = normalize(item.title)
-        if not title_norm:
-            continue
-        
-        matched = False
+    for row in tqdm(rows, unit="item"):
+        mbid = row["mb_artistid"]
+        artist_norm = normalize(row["artist"])
+        albumartist_norm = normalize(row["albumartist"])
         
-        # Check MBID first (most accurate)
-        mbid = item.get("mb_artistid")
-        if mbid and ('mbid', mbid, title_norm) in target_keys:
-            if item.id not in seen_ids:
-                matches.append(item)
-                seen_ids.add(item.id)
-                mbid_matches += 1
-                matched = True
-        
-        if matched:
+        # Scraped titles for each identity of this row: MBID first (most
+        # accurate), then the artist name, then the album artist for
+        # various artists / compilations.
+        mbid_titles = mbid_map.get(mbid) if mbid else None
+        artist_titles = name_map.get(artist_norm)
+        albumartist_titles = (
+            name_map.get(albumartist_norm)
+            if albumartist_norm != artist_norm
+            else None
+        )
+        if not (mbid_titles or artist_titles or albumartist_titles):
             continue
-            
-        # Check artist name
-        artist_norm = normalize(item.artist)
-        if artist_norm and ('name', artist_norm, title_norm) in target_keys:
-            if item.id not in seen_ids:
-                matches.append(item)
-                seen_ids.add(item.id)
-                name_matches += 1
-                matched = True
-                
-        if matched:
+        
+        title_norm = normalize(row["title"])
+        if not title_norm:
             continue
-            
-        # Optional: Check album artist for various artists / compilations
-        albumartist_norm = normalize(item.albumartist)
-        if albumartist_norm and albumartist_norm != artist_norm and ('name', albumartist_norm, title_norm) in target_keys:
-            if item.id not in seen_ids:
-                matches.append(item)
-                seen_ids.add(item.id)
-                name_matches += 1
-
-    print(f"  Matches found: {len(matches)} (MBID: {mbid_matches}, Name: {name_matches})")
+        
+        if mbid_titles and title_norm in mbid_titles:
+            matched_ids.append(row["id"])
+            mbid_matches += 1
+        elif (artist_titles and title_norm in artist_titles) or (
+            albumartist_titles and title_norm in albumartist_titles
+        ):
+            matched_ids.append(row["id"])
+            name_matches += 1
+        elif fuzzy_score and any(
+            get_close_matches(title_norm, titles, n=1, cutoff=fuzzy_cutoff)
+            for titles in (mbid_titles, artist_titles, albumartist_titles)
+            if titles
+        ):
+            matched_ids.append(row["id"])
+            fuzzy_matches += 1
+
+    matches = [lib.get_item(item_id) for item_id in matched_ids]
+    print(
+        f"  Matches found: {len(matches)} (MBID: {mbid_matches}, "
+        f"Name: {name_matches}, Fuzzy: {fuzzy_matches})"
+    )
     return matches
 
 
@@ -237,29 +325,64 @@ def find_matches(
 # TAGGING
 # ----------------------------
 
-def tag_items(items: list[Item], dry_run: bool) -> list[dict[str, str]]:
-    """Tag items with CWW genre, return preview of changes."""
+def tag_items(lib: Library, items: list[Item], dry_run: bool) -> list[dict[str, str]]:
+    """Tag items with CWW genre, return preview of changes.
+
+    File tags are written first, in parallel, one file per worker thread;
+    only items whose file was written are then stored, in a single
+    transaction, so the library never claims a tag the file lacks.
+    """
     preview: list[dict[str, str]] = []
+    to_write: list[Item] = []
 
     print(f"  {'Pre-viewing' if dry_run else 'Tagging'} {len(items)} items...")
     for item in tqdm(items, unit="track", disable=len(items) < 10):
-        existing = _get_genres(item)
-
-        genres_set = set(existing)
-
-        if GENRE_TAG not in genres_set:
-            genres_set.add(GENRE_TAG)
-
-            preview.append({
-                "artist": item.artist,
-                "title": item.title,
-                "path": item.path.decode("utf-8", "ignore"),
-            })
+        if _is_tagged(item):
+            continue
 
-            if not dry_run:
-                _set_genres(item, sorted(genres_set))
-                item.store()
-                item.write()
+        preview.append({
+            "artist": item.artist,
+            "title": item.title,
+            "path": item.path.decode("utf-8", "ignore"),
+        })
+
+        if not dry_run:
+            existing = _get_genres(item)
+            # Most matches carry no genre yet; only dedupe/sort otherwise
+            if existing:
+                _set_genres(item, sorted({*existing, GENRE_TAG}))
+            else:
+                _set_genres(item, [GENRE_TAG])
+            to_write.append(item)
+
+    if to_write:
+        # Library order is unrelated to disk layout; grouping files by
+        # directory keeps metadata and readahead caches warm.
+        to_write.sort(key=lambda item: item.path)
+        with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+            written = list(tqdm(
+                executor.map(Item.try_write, to_write),
+                total=len(to_write),
+                unit="file",
+                disable=len(to_write) < 10,
+            ))
+
+        failed: list[Item] = []
+        with lib.transaction():
+            for item, ok in zip(to_write, written):
+                if ok:
+                    item.store()
+                else:
+                    failed.append(item)
+
+        if failed:
+            print(
+                f"  Could not write {len(failed)} files; "
+                "their library entries were left unchanged:",
+                file=sys.stderr,
+            )
+            for item in failed:
+                print(f"    {item.path.decode('utf-8', 'ignore')}", file=sys.stderr)
 
     return preview
 
@@ -292,20 +415,19 @@ def main() -> None:
         default=0,
         help="Minimum similarity score to use from MB cache (0-100)",
     )
+    parser.add_argument(
+        "--fuzzy-score",
+        type=int,
+        default=0,
+        choices=range(101),
+        metavar="0-100",
+        help="Fuzzy-match unmatched titles at this similarity (0 = off)",
+    )
 
     args = parser.parse_args()
 
     print("Loading episode JSON...")
-
-    try:
-        with open(args.input, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        print(f"Error: Input file not found: {args.input}", file=sys.stderr)
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON in {args.input}: {e}", file=sys.stderr)
-        sys.exit(1)
+    episodes = load_episodes(args.input)
 
     # Load artist cache
     artist_cache: dict[str, Any] = {}
@@ -325,28 +447,42 @@ def main() -> None:
             if removed > 0:
                 print(f"  Filtered out {removed} entries with score < {args.min_score}")
 
+    print("Building target lookup set from scraped tracks...")
+    name_map, mbid_map = build_targets(episodes, artist_cache)
+    target_count = sum(len(titles) for titles in name_map.values()) + sum(
+        len(titles) for titles in mbid_map.values()
+    )
+    print(
+        f"  Created {target_count} matching targets "
+        f"for {len(name_map) + len(mbid_map)} artists."
+    )
+    # Only the targets are needed from here on; release the episode list
+    # before the library is loaded and scanned.
+    del episodes
+
     print("Loading beets library...")
     lib = load_library()
 
     print("Finding matches...")
     matches = find_matches(
-        data,
+        name_map,
+        mbid_map,
         lib,
-        artist_cache if not args.no_cache else None,
+        fuzzy_score=args.fuzzy_score,
     )
 
     actual_to_tag = sum(
         1 for item in matches
-        if GENRE_TAG not in _get_genres(item)
+        if not _is_tagged(item)
     )
 
     print(f"Matches found: {len(matches)}")
     print(f"New tags to apply: {actual_to_tag}")
 
-    preview = tag_items(matches, args.dry_run)
+    preview = tag_items(lib, matches, args.dry_run)
 
-    with open(PREVIEW_FILE, "w", encoding="utf-8") as f:
-        json.dump(preview, f, indent=2, ensure_ascii=False)
+    with open(PREVIEW_FILE, "wb") as f:
+        f.write(orjson.dumps(preview, option=orjson.OPT_INDENT_2))
 
     print(f"Preview written: {PREVIEW_FILE}")
 
@@ -8,22 +8,26 @@ is set in .env, it will fall back to the MusicBrainz API for unknown artists.
 If not set, it operates in a fast local-only mode.
 """
 
-import json
 import os
-import re
 import sys
 import time
 from pathlib import Path
-from collections import Counter
-from typing import Any
-from difflib import SequenceMatcher
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Any
+from difflib import SequenceMatcher, get_close_matches
 
-# import requests  # Moved to lazy import in lookup_artist_with_uncertain
+import orjson
+# import requests  # Moved to lazy import in _get_session / _search_musicbrainz
 from beets import config
 from beets.library import Library
 from dotenv import load_dotenv
 from tqdm import tqdm
 
+from normalization import normalize
+
+if TYPE_CHECKING:
+    import requests
+
 load_dotenv()
 
 USER_AGENT = os.environ.get("MUSICBRAINZ_USER_AGENT")
@@ -31,6 +35,17 @@ USER_AGENT = os.environ.get("MUSICBRAINZ_USER_AGENT")
 CACHE_FILE = "artist_cache.json"
 INPUT_FILE = "episodes.json"
 REQUEST_DELAY = 0.25  # 4 req/sec to be safe
+MB_BATCH_SIZE = 10  # Artists per Lucene OR search
+MB_BATCH_LIMIT = 100  # Max results MB returns per search
+# Larger batches leave too few of the MB_BATCH_LIMIT results per artist
+MAX_MB_BATCH_SIZE = 25
+BEETS_FUZZY_CUTOFF = 0.9  # Min similarity for a fuzzy beets match
+
+# Start time of the most recent MusicBrainz request (time.monotonic())
+_last_request = 0.0
+
+# Shared MusicBrainz HTTP session, created on first use
+_session = None
 
 def dedupe_cache(cache: dict) -> dict:
     """
@@ -75,108 +90,125 @@ def load_file_index(path: str) -> set[str]:
 def load_episodes(path: str) -> list[dict]:
     """Load episodes from JSON file."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         print(f"Error: {path} not found", file=sys.stderr)
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"Error: Invalid JSON in {path}: {e}", file=sys.stderr)
         sys.exit(1)
 
 
 def extract_artists(episodes: list[dict]) -> list[tuple[str, int]]:
     """Extract unique artists with counts from episodes."""
-    artist_counts: Counter = Counter()
-
-    for episode in episodes:
-        for track in episode.get("tracklist", []):
-            artist = track.get("artist", "").strip()
-            if artist:
-                artist_counts[artist] += 1
+    # One flat pass feeding Counter's C update loop; strip each name once
+    artist_counts = Counter(
+        artist
+        for episode in episodes
+        for track in episode.get("tracklist", ())
+        if (artist := track.get("artist", "").strip())
+    )
 
     # Sort by frequency (most common first)
     return artist_counts.most_common()
 
 
-def load_beets_library() -> dict[str, dict[str, Any]]:
-    """Load artists from beets library for local matching."""
+def load_beets_library() -> tuple[dict[str, dict[str, Any]], set[str]]:
+    """
+    Load artists from beets library for local matching.
+    Returns (artists, normalized): artists is keyed by both the raw and the
+    normalized name; normalized holds just the normalized keys.
+    """
 
     try:
         config.read()
         library_path = config["library"].as_filename()
     except Exception as e:
         print(f"  Warning: Could not read beets config: {e}", file=sys.stderr)
-        return {}
+        return {}, set()
 
     if not library_path:
         print("  Warning: No library path in beets config", file=sys.stderr)
-        return {}
+        return {}, set()
 
     if not Path(library_path).exists():
         print(f"  Warning: Library file not found: {library_path}", file=sys.stderr)
-        return {}
+        return {}, set()
 
     print("  Opening library...", flush=True)
     try:
         lib = Library(library_path)
     except Exception as e:
         print(f"  Warning: Could not open library: {e}", file=sys.stderr)
-        return {}
+        return {}, set()
 
     print(f"  Loading artists from {library_path}...", flush=True)
 
     artists: dict[str, dict[str, Any]] = {}
+    normalized: set[str] = set()
 
     try:
-        count = 0
-        for item in lib.items():
-            artist = item.artist
-            if artist:
-                normalized = normalize(artist)
-                if artist not in artists:
-                    artists[artist] = {
-                        "source": "beets",
-                        "original": artist,
-                    }
-                if normalized not in artists:
-                    artists[normalized] = {
-                        "source": "beets",
-                        "original": artist,
-                    }
-            count += 1
-            if count % 5000 == 0:
-                print(f"    {count} items processed...", flush=True)
+        # Only the artist column is needed, so skip building Item objects.
+        # The first spelling of a normalized name wins, so order by the key
+        # beets' default item sort uses in SQL: LOWER(), which (like NOCASE)
+        # only folds ASCII. Spellings that differ only in case are ordered
+        # by raw name here, where lib.items() ordered them by album.
+        with lib.transaction() as tx:
+            rows = tx.query(
+                "SELECT DISTINCT artist FROM items WHERE artist != '' "
+                "ORDER BY LOWER(artist), artist"
+            )
+        print(f"    {len(rows)} distinct artists in library", flush=True)
+        for (artist,) in rows:
+            entry = {"source": "beets", "original": artist}
+            artists.setdefault(artist, entry)
+            key = normalize(artist)
+            artists.setdefault(key, entry)
+            normalized.add(key)
     except Exception as e:
         print(f"  Warning: Error loading items: {e}", file=sys.stderr)
 
     print(f"  Loaded {len(artists)} unique artist names", flush=True)
-    return artists
+    return artists, normalized
+
+
+def journal_path(path: str) -> Path:
+    """Path of the append-only journal written alongside a cache file."""
+    return Path(f"{path}.log")
 
 
 def load_cache(path: str) -> dict:
-    """Load existing artist cache."""
+    """Load existing artist cache, replaying entries left in its journal."""
+    cache: dict = {}
     if Path(path).exists():
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+        with open(path, "rb") as f:
+            cache = orjson.loads(f.read())
+
+    journal = journal_path(path)
+    if journal.exists():
+        with open(journal, "rb") as f:
+            for line in f:
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue  # Partial line from an interrupted run
+                for key in record["keys"]:
+                    cache[key] = record["value"]
+    return cache
 
 
 def save_cache(cache: dict, path: str) -> None:
-    """Save artist cache to file."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(cache, f, indent=2, ensure_ascii=False)
-
+    """Save artist cache to file and drop the journal it now contains.
 
-def normalize(text: str) -> str:
-    """Basic normalization for matching."""
-    text = text.lower()
-    text = re.sub(r"\(.*?\)", "", text)
-    text = text.replace("&", "and")
-    text = text.replace("/", " ")
-    text = re.sub(r"[^\w\s]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    The cache is written to a temporary file and renamed over the old one,
+    so an interrupted save never leaves a truncated cache behind.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
+    journal_path(path).unlink(missing_ok=True)
 
 
 def calculate_similarity(a: str, b: str) -> int:
@@ -190,6 +222,167 @@ def calculate_similarity(a: str, b: str) -> int:
     return int(ratio * 100)
 
 
+def _throttle() -> None:
+    """Wait until REQUEST_DELAY has passed since the previous MB request started.
+
+    Time spent waiting on the previous response counts towards the delay,
+    and artists resolved from beets or the cache never wait at all.
+    """
+    global _last_request
+    wait = _last_request + REQUEST_DELAY - time.monotonic()
+    if wait > 0:
+        time.sleep(wait)
+    _last_request = time.monotonic()
+
+
+def _respect_rate_limit(headers: Any) -> None:
+    """Hold the next MB request until the rate-limit window resets.
+
+    Only kicks in when MusicBrainz reports (X-RateLimit-Remaining) that
+    fewer than two requests are left before X-RateLimit-Reset.
+    """
+    global _last_request
+    try:
+        remaining = int(headers["X-RateLimit-Remaining"])
+        reset = float(headers["X-RateLimit-Reset"])
+    except (KeyError, ValueError):
+        return
+    if remaining >= 2:
+        return
+    # Reset is a Unix timestamp; cap the wait in case the clocks disagree
+    wait = min(reset - time.time(), 60.0)
+    if wait > 0:
+        # _throttle() waits REQUEST_DELAY past this start time
+        _last_request = max(
+            _last_request, time.monotonic() + wait - REQUEST_DELAY
+        )
+
+
+def _get_session() -> "requests.Session":
+    """
+    Return the shared MusicBrainz session.
+    Keeps the connection alive between lookups and retries connection
+    errors and 429/503 responses with exponential backoff.
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[429, 503],
+            raise_on_status=False,
+        )
+        _session = requests.Session()
+        _session.headers["User-Agent"] = USER_AGENT
+        _session.mount("https://", HTTPAdapter(max_retries=retry))
+    return _session
+
+
+def _search_musicbrainz(query: str, limit: int) -> list[dict] | None:
+    """
+    Run a MusicBrainz artist search (retries are handled by the session).
+    Returns the list of artists, or None if the request failed.
+    """
+    import requests
+    url = "https://musicbrainz.org/ws/2/artist"
+    params = {"query": query, "fmt": "json", "limit": limit}
+
+    try:
+        _throttle()
+        resp = _get_session().get(url, params=params, timeout=15)
+        _respect_rate_limit(resp.headers)
+        if resp.status_code != 200:
+            return None
+        # A 200 that isn't JSON (proxy or maintenance page) raises
+        # requests.JSONDecodeError, a RequestException
+        return resp.json().get("artists", [])
+    except requests.RequestException:
+        return None
+
+
+def _best_artist(name: str, artists: list[dict]) -> tuple[dict | None, int]:
+    """
+    Pick the MB artist whose name or alias is most similar to name.
+
+    Scores match calculate_similarity(). Candidates whose real_quick_ratio()
+    or quick_ratio() upper bound can't beat the best score so far are
+    skipped without computing the full ratio().
+    """
+    matcher = SequenceMatcher(None, normalize(name))
+    best_artist = None
+    best_similarity = -1
+
+    for artist in artists:
+        # Check the MB artist name and its aliases for better matching
+        candidates = [artist.get("name", "")]
+        candidates.extend(alias.get("name", "") for alias in artist.get("aliases", []))
+
+        sim = 0
+        for candidate in candidates:
+            if not name or not candidate:
+                continue
+            matcher.set_seq2(normalize(candidate))
+            # ratio() <= quick_ratio() <= real_quick_ratio()
+            floor = max(sim, best_similarity)
+            if (
+                int(matcher.real_quick_ratio() * 100) <= floor
+                or int(matcher.quick_ratio() * 100) <= floor
+            ):
+                continue
+            sim = max(sim, int(matcher.ratio() * 100))
+
+        if sim > best_similarity:
+            best_similarity = sim
+            best_artist = artist
+
+        # If we found an exact match, we can stop
+        if sim == 100:
+            break
+
+    return best_artist, best_similarity
+
+
+def _artist_result(artist: dict, similarity: int) -> dict:
+    """Build a cache entry from a MusicBrainz artist."""
+    return {
+        "mbid": artist.get("id"),
+        "canonical_name": artist.get("name"),
+        "sort_name": artist.get("sort-name"),
+        "mb_score": int(artist.get("score", 0)),
+        "score": similarity,  # Repurpose score to mean our similarity
+        "source": "musicbrainz",
+    }
+
+
+def _lucene_phrase(text: str) -> str:
+    """Quote text as a Lucene phrase."""
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def lookup_artists_batch(names: list[str], min_score: int = 85) -> dict[str, dict]:
+    """
+    Look up several artists on MusicBrainz with a single Lucene OR query.
+    Returns {name: result} for names whose best candidate reaches min_score.
+    Names missing from the result should be looked up individually, which
+    also takes care of reporting uncertain matches.
+    """
+    query = " OR ".join(f"artist:{_lucene_phrase(name)}" for name in names)
+    artists = _search_musicbrainz(query, limit=MB_BATCH_LIMIT)
+    if not artists:
+        return {}
+
+    results = {}
+    for name in names:
+        best_artist, best_similarity = _best_artist(name, artists)
+        if best_artist and best_similarity >= min_score:
+            results[name] = _artist_result(best_artist, best_similarity)
+    return results
+
+
 def lookup_artist_with_uncertain(
     name: str, min_score: int = 85
 ) -> tuple[dict | None, dict | None]:
@@ -198,65 +391,81 @@ def lookup_artist_with_uncertain(
     Returns (result, uncertain_result) where uncertain_result has low confidence.
     Uses string similarity to verify MusicBrainz matches against the query.
     """
-    import requests
-    url = "https://musicbrainz.org/ws/2/artist"
     # Fetch top 10 results to find the best string match
-    params = {"query": name, "fmt": "json", "limit": 10}
-    headers = {"User-Agent": USER_AGENT}
-
-    for attempt in range(3):
-        try:
-            resp = requests.get(url, params=params, headers=headers, timeout=15)
-            if resp.status_code == 200:
-                data = resp.json()
-                if not data.get("artists"):
-                    return (None, None)
-
-                best_artist = None
-                best_similarity = -1
-
-                for artist in data["artists"]:
-                    mb_name = artist.get("name", "")
-                    # Calculate similarity between our query and MB artist name
-                    sim = calculate_similarity(name, mb_name)
-
-                    # Also check aliases for better matching
-                    for alias in artist.get("aliases", []):
-                        alias_name = alias.get("name", "")
-                        sim = max(sim, calculate_similarity(name, alias_name))
-
-                    if sim > best_similarity:
-                        best_similarity = sim
-                        best_artist = artist
-
-                    # If we found an exact match, we can stop
-                    if sim == 100:
-                        break
-
-                if best_artist:
-                    result_data = {
-                        "mbid": best_artist.get("id"),
-                        "canonical_name": best_artist.get("name"),
-                        "sort_name": best_artist.get("sort-name"),
-                        "mb_score": int(best_artist.get("score", 0)),
-                        "score": best_similarity,  # Repurpose score to mean our similarity
-                        "source": "musicbrainz",
-                    }
-
-                    if best_similarity >= min_score:
-                        return (result_data, None)
-                    else:
-                        # Return as uncertain - below threshold but MB found something
-                        return (None, result_data)
-                return (None, None)
-            elif resp.status_code == 503:
-                wait = 2**attempt
-                time.sleep(wait)
-            else:
-                return (None, None)
-        except requests.RequestException:
-            time.sleep(2**attempt)
-    return (None, None)
+    artists = _search_musicbrainz(name, limit=10)
+    if not artists:
+        return (None, None)
+
+    best_artist, best_similarity = _best_artist(name, artists)
+    if not best_artist:
+        return (None, None)
+
+    result_data = _artist_result(best_artist, best_similarity)
+    if best_similarity >= min_score:
+        return (result_data, None)
+    # Return as uncertain - below threshold but MB found something
+    return (None, result_data)
+
+
+def _fuzzy_key(name: str) -> tuple[int, str]:
+    """
+    Bucket a normalized name for fuzzy matching: word count and first word.
+
+    Only names that agree on both are compared, so a close spelling of a
+    later word still matches ("jon smith band" -> "jon smith bnad") while
+    different first names ("jon smith" vs "john smith") never do. Single
+    words are bucketed by their first letter.
+    """
+    words = name.split()
+    return len(words), words[0] if len(words) > 1 else name[:1]
+
+
+def fuzzy_buckets(names: set[str]) -> dict[tuple[int, str], list[str]]:
+    """Group normalized names by _fuzzy_key() for resolve_artist()."""
+    buckets: dict[tuple[int, str], list[str]] = defaultdict(list)
+    for name in sorted(names):
+        if name:
+            buckets[_fuzzy_key(name)].append(name)
+    return dict(buckets)
+
+
+def resolve_artist_offline(
+    scraped_artist: str,
+    beets_artists: dict[str, dict],
+    cache: dict,
+    beets_buckets: dict[tuple[int, str], list[str]] | None = None,
+    normalized: str | None = None,
+) -> tuple[dict | None, str | None]:
+    """
+    Steps 1-5 of resolve_artist(): everything that needs no MusicBrainz call.
+    Returns (entry, match_type), or (None, None) if nothing matched.
+    """
+    if normalized is None:
+        normalized = normalize(scraped_artist)
+
+    # 1-4. Exact and normalized match in beets, then in the cache
+    for source, key, match_type in (
+        (beets_artists, scraped_artist, "beets_exact"),
+        (beets_artists, normalized, "beets_normalized"),
+        (cache, scraped_artist, "cache_exact"),
+        (cache, normalized, "cache_normalized"),
+    ):
+        entry = source.get(key)
+        if entry is not None:
+            return entry, match_type
+
+    # 5. Fuzzy match in beets, catching near-identical spellings offline
+    if beets_buckets and normalized:
+        close = get_close_matches(
+            normalized,
+            beets_buckets.get(_fuzzy_key(normalized), ()),
+            n=1,
+            cutoff=BEETS_FUZZY_CUTOFF,
+        )
+        if close:
+            return beets_artists[close[0]], "beets_fuzzy"
+
+    return None, None
 
 
 def resolve_artist(
@@ -266,45 +475,45 @@ def resolve_artist(
     mb_lookup: bool = True,
     min_score: int = 85,
     uncertain_matches: list | None = None,
-) -> dict | None:
+    prefetched: dict[str, dict] | None = None,
+    beets_buckets: dict[tuple[int, str], list[str]] | None = None,
+    normalized: str | None = None,
+) -> tuple[dict | None, str | None]:
     """
     Resolve scraped artist name to canonical form.
-    
+    Returns (entry, match_type), or (None, None) if nothing matched. The
+    entry may be shared with beets_artists or cache; don't mutate it.
+
+    normalized may be passed in when the caller already computed
+    normalize(scraped_artist).
+
     Strategy:
     1. Exact match in beets library
     2. Normalized match in beets library
     3. Exact match in cache
     4. Normalized match in cache
-    5. MB API with full name
-    6. MB API with normalized name
+    5. Fuzzy match against normalized beets names in the same bucket
+       (if beets_buckets, from fuzzy_buckets(), is given)
+    6. MB API with full name (batched lookup result if prefetched)
+    7. MB API with normalized name
     """
-    # 1. Exact match in beets
-    if scraped_artist in beets_artists:
-        result = beets_artists[scraped_artist].copy()
-        result["match_type"] = "beets_exact"
-        return result
-
-    # 2. Normalized match in beets
-    normalized = normalize(scraped_artist)
-    if normalized in beets_artists:
-        result = beets_artists[normalized].copy()
-        result["match_type"] = "beets_normalized"
-        return result
-
-    # 3. Check cache (both full and normalized)
-    if scraped_artist in cache:
-        result = cache[scraped_artist].copy()
-        result["match_type"] = "cache_exact"
-        return result
-    if normalized in cache:
-        result = cache[normalized].copy()
-        result["match_type"] = "cache_normalized"
-        return result
+    if normalized is None:
+        normalized = normalize(scraped_artist)
+
+    # 1-5. Beets and cache lookups, no network
+    entry, match_type = resolve_artist_offline(
+        scraped_artist, beets_artists, cache, beets_buckets, normalized
+    )
+    if entry is not None:
+        return entry, match_type
 
     if not mb_lookup:
-        return None
+        return None, None
+
+    # 6. MB API with full name
+    if prefetched and scraped_artist in prefetched:
+        return prefetched.pop(scraped_artist), "mb_batch"
 
-    # 5. MB API with full name
     result, uncertain = lookup_artist_with_uncertain(scraped_artist, min_score)
     if uncertain and uncertain_matches is not None:
         uncertain_matches.append({
@@ -313,10 +522,9 @@ def resolve_artist(
             "score": uncertain.get("score"),
         })
     if result:
-        result["match_type"] = "mb_full"
-        return result
+        return result, "mb_full"
 
-    # 6. MB API with normalized name
+    # 7. MB API with normalized name
     result, uncertain = lookup_artist_with_uncertain(normalized, min_score)
     if uncertain and uncertain_matches is not None:
         uncertain_matches.append({
@@ -325,10 +533,9 @@ def resolve_artist(
             "score": uncertain.get("score"),
         })
     if result:
-        result["match_type"] = "mb_normalized"
-        return result
+        return result, "mb_normalized"
 
-    return None
+    return None, None
 
 
 def main():
@@ -372,6 +579,17 @@ def main():
         default=85,
         help="Minimum confidence score for MB matches (0-100, default 85)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=MB_BATCH_SIZE,
+        choices=range(1, MAX_MB_BATCH_SIZE + 1),
+        metavar=f"1-{MAX_MB_BATCH_SIZE}",
+        help=(
+            f"Artists per batched MB search (default {MB_BATCH_SIZE}, "
+            "1 = one search per artist)"
+        ),
+    )
     parser.add_argument(
         "--export-uncertain",
         type=str,
@@ -387,8 +605,9 @@ def main():
 
     
     print(f"Loading episodes from {args.input}...")
-    episodes = load_episodes(args.input)
-    artists = extract_artists(episodes)
+    # Only the artist counts are needed; don't keep the episodes around
+    # for the (long) resolve phase
+    artists = extract_artists(load_episodes(args.input))
 
     print(f"Found {len(artists)} unique artists")
     print(f"Total tracks: {sum(c for _, c in artists)}")
@@ -396,16 +615,21 @@ def main():
 
     # Load beets library for local matching
     beets_artists: dict[str, dict] = {}
+    beets_normalized: set[str] = set()
     if not args.no_beets:
         print("Loading beets library...")
         sys.stdout.flush()
-        beets_artists = load_beets_library()
+        beets_artists, beets_normalized = load_beets_library()
         print(f"Beets artists: {len(beets_artists)}")
         sys.stdout.flush()
 
     cache = load_cache(args.cache)
     print(f"Existing cache entries: {len(cache)}")
 
+    # Fold in a journal left by an interrupted run before appending to it
+    if not args.dry_run and journal_path(args.cache).exists():
+        save_cache(cache, args.cache)
+
     # Filter out already-cached artists
     artists_to_lookup = []
     for artist, count in artists:
@@ -434,8 +658,10 @@ def main():
     stats = {
         "beets_exact": 0,
         "beets_normalized": 0,
+        "beets_fuzzy": 0,
         "cache_exact": 0,
         "cache_normalized": 0,
+        "mb_batch": 0,
         "mb_full": 0,
         "mb_normalized": 0,
         "uncertain": 0,
@@ -445,44 +671,67 @@ def main():
     # Track uncertain matches for manual review
     uncertain_matches: list[dict] = []
 
+    # Normalized beets names for fuzzy matching; only keys load_beets_library
+    # inserted, so every candidate can be looked up in beets_artists
+    beets_buckets = fuzzy_buckets(beets_normalized)
+
+    # Confident results from batched MB searches, keyed by scraped name
+    prefetched: dict[str, dict] = {}
+    batch_size = args.batch_size
+
     print(f"\nResolving {len(artists_to_lookup)} artists...")
     print(f"Min MB score: {args.min_score}%")
     pbar = tqdm(artists_to_lookup, unit="artist")
-    for i, (artist, normalized, count) in enumerate(pbar):
-        result = resolve_artist(
-            artist, beets_artists, cache,
-            mb_lookup=not args.no_mb,
-            min_score=args.min_score,
-            uncertain_matches=uncertain_matches,
-        )
-
-        if result:
-            match_type = result.get("match_type", "unknown")
-            stats[match_type] = stats.get(match_type, 0) + 1
-
-            # Remove match_type from result before caching (it's just for stats)
-            result_for_cache = {k: v for k, v in result.items() if k != "match_type"}
-
-            # Cache both full name and normalized
-            cache[artist] = result_for_cache
-            cache[normalized] = result_for_cache
-
-            # Use tqdm.write instead of print to avoid breaking the progress bar
-            if match_type in ("beets_exact", "beets_normalized"):
-                pbar.write(f"  ✓ beets match: {artist} -> {result_for_cache.get('original', 'unknown')}")
-            elif match_type in ("mb_full", "mb_normalized"):
-                pbar.write(f"  ✓ MB match: {artist} -> {result_for_cache.get('canonical_name', 'unknown')}")
-
-            # Incremental save every 50 artists
-            if (i + 1) % 50 == 0:
-                save_cache(cache, args.cache)
-                pbar.write(f"  [Checkpoint: {len(cache)} entries saved]")
-        else:
-            stats["not_found"] += 1
-            # Don't cache failures - might find them later with different approach
-
-        if not args.no_mb:
-            time.sleep(REQUEST_DELAY)
+    # New entries are appended to a journal instead of rewriting the
+    # whole cache; the final save folds them in and removes the journal
+    with open(journal_path(args.cache), "ab") as journal:
+        for i, (artist, normalized, count) in enumerate(pbar):
+            # Search the next batch of artists that can't be resolved offline
+            # in one request; anything it misses falls back to the per-artist
+            # lookup
+            if not args.no_mb and i % batch_size == 0:
+                prefetched = {}
+                pending = [
+                    a for a, n, _ in artists_to_lookup[i:i + batch_size]
+                    if resolve_artist_offline(
+                        a, beets_artists, cache, beets_buckets, n
+                    )[0] is None
+                ]
+                if len(pending) > 1:
+                    prefetched = lookup_artists_batch(pending, args.min_score)
+
+            result, match_type = resolve_artist(
+                artist, beets_artists, cache,
+                mb_lookup=not args.no_mb,
+                min_score=args.min_score,
+                uncertain_matches=uncertain_matches,
+                prefetched=prefetched,
+                beets_buckets=beets_buckets,
+                normalized=normalized,
+            )
+
+            if result:
+                stats[match_type] = stats.get(match_type, 0) + 1
+
+                # Cache both full name and normalized
+                cache[artist] = result
+                cache[normalized] = result
+
+                # Use tqdm.write instead of print to avoid breaking the progress bar
+                if match_type in ("beets_exact", "beets_normalized", "beets_fuzzy"):
+                    pbar.write(f"  ✓ beets match: {artist} -> {result.get('original', 'unknown')}")
+                elif match_type in ("mb_batch", "mb_full", "mb_normalized"):
+                    pbar.write(f"  ✓ MB match: {artist} -> {result.get('canonical_name', 'unknown')}")
+
+                # Journal the entry right away so an interrupted run keeps it
+                journal.write(orjson.dumps({
+                    "keys": [artist, normalized],
+                    "value": result,
+                }) + b"\n")
+                journal.flush()
+            else:
+                stats["not_found"] += 1
+                # Don't cache failures - might find them later with different approach
 
     # Final save
     save_cache(cache, args.cache)
@@ -496,8 +745,8 @@ def main():
 
     # Export uncertain matches if requested
     if args.export_uncertain and uncertain_matches:
-        with open(args.export_uncertain, "w", encoding="utf-8") as f:
-            json.dump(uncertain_matches, f, indent=2, ensure_ascii=False)
+        with open(args.export_uncertain, "wb") as f:
+            f.write(orjson.dumps(uncertain_matches, option=orjson.OPT_INDENT_2))
         print(f"\nUncertain matches exported to: {args.export_uncertain}")
         print(f"  Total uncertain: {len(uncertain_matches)}")
 
@@ -0,0 +1,86 @@
+"""
+Name and title normalization shared by build_artist_cache.py and add_cww_genre.py.
+
+add_cww_genre.py looks up artist_cache.json keys that build_artist_cache.py
+produced with normalize(), so both scripts must use this one implementation.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+# normalize() runs for every artist, title and similarity check; compile once.
+_RE_PAREN = re.compile(r"\(.*?\)")
+# Accents are folded away only on these scripts (Björk -> bjork); in kana,
+# Devanagari and the like, combining marks are part of the letter.
+_FOLDED_SCRIPTS = ("LATIN ", "GREEK ", "CYRILLIC ")
+
+# Every ASCII character that [^\w\s] would replace, mapped to a space.
+# "&" is expanded to "and" before the table is applied.
+_PUNCT_TABLE = str.maketrans({
+    c: " "
+    for c in map(chr, range(128))
+    if not (c.isalnum() or c == "_" or c.isspace())
+})
+
+
+def _fold_diacritics(text: str) -> str:
+    """Fold accents away, treating each combining mark as part of its base.
+
+    Marks are dropped when their base is ASCII, Latin, Greek or Cyrillic
+    (Björk -> Bjork), or punctuation, a symbol, a control character or a
+    space, which normalize() blanks anyway. Marks on other scripts (kana,
+    Devanagari) are kept, except variation selectors, which never carry
+    part of a letter (the emoji selector in "❤️").
+    """
+    kept = []
+    drop_marks = True  # A mark with no base character is dropped too
+    for c in unicodedata.normalize("NFKD", text):
+        category = unicodedata.category(c)
+        if category[0] == "M":
+            if drop_marks or unicodedata.name(c, "").startswith(
+                "VARIATION SELECTOR"
+            ):
+                continue
+        else:
+            drop_marks = (
+                c.isascii()
+                or category[0] in "PSCZ"
+                or unicodedata.name(c, "").startswith(_FOLDED_SCRIPTS)
+            )
+        kept.append(c)
+    # Recompose the marks that were kept (e.g. kana voicing marks)
+    return unicodedata.normalize("NFC", "".join(kept))
+
+
+def _strip_symbols(text: str) -> str:
+    """Replace punctuation, symbols and control characters with spaces.
+
+    Combining marks are kept, so Devanagari and kana words stay whole.
+    """
+    return "".join(
+        " " if c != "_" and unicodedata.category(c)[0] in "PSC" else c
+        for c in text
+    )
+
+
+@lru_cache(maxsize=131072)
+def normalize(text: str) -> str:
+    """Basic normalization for matching."""
+    if not text:
+        return ""
+
+    if not text.isascii():
+        # Casefold first so each mark is judged by the base it ends up on
+        # (Ↄ -> ↄ is Latin only once lowercased); NFKD can reintroduce
+        # capitals (ℌ -> H), hence the second casefold below.
+        text = _fold_diacritics(text.casefold())
+    text = text.casefold()
+    if "(" in text:
+        text = _RE_PAREN.sub("", text)
+    text = text.replace("&", "and")
+    text = text.translate(_PUNCT_TABLE)
+    if not text.isascii():
+        text = _strip_symbols(text)
+
+    return " ".join(text.split())
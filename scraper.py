@@ -5,36 +5,105 @@ Extracts episode data including soundcloud URL, thumbnail, and tracklist.
 """
 
 import argparse
-import json
 import re
+import threading
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from typing import Any
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from lxml import etree
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 from urllib.parse import urljoin, unquote, urlparse
+from urllib3.util.retry import Retry
 
 BASE_URL = "https://www.chanceswithwolves.com"
 OUTPUT_FILE = "episodes.json"
 LATEST_EPISODE_INFO_FILE = "latest_episode_info.json"
 DEFAULT_REQUEST_DELAY = 0.5
-
+REQUEST_RETRIES = 3
+SCRAPE_WORKERS = 8
+MAX_SCRAPE_WORKERS = 32
+# Non-empty sibling blocks without tracks in a row that end a started
+# tracklist; a note or header inside a tracklist block never counts
+TRACKLIST_MAX_MISSES = 3
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+
+# Parse only the parts of a page that are read. A strainer applies to
+# top-level elements; everything nested inside a kept element is kept.
+EPISODE_STRAINER = SoupStrainer([
+    "title", "main", "article", "section", "div",
+    "figure", "iframe", "h1", "h2", "h3",
+])
+# The homepage is read for its episode articles and the RADIO SHOWS menu
+# items in get_episode_range_urls(); skip scripts, styles and page chrome.
+HOMEPAGE_STRAINER = SoupStrainer(["li", "article"])
+# Range pages only need the episode links, so they skip BeautifulSoup and
+# take the first masonry-link href of each masonry-item article via lxml
+_XPATH_HAS_CLASS = 'contains(concat(" ", normalize-space(@class), " "), " {} ")'
+_XPATH_EPISODE_LINKS = etree.XPath(
+    f"//article[{_XPATH_HAS_CLASS.format('masonry-item')}]"
+    f"/descendant::a[{_XPATH_HAS_CLASS.format('masonry-link')}][1]/@href"
+)
+
+# Compiled once; these run for every URL and every page.
+# Episode number patterns for _get_episode_number_from_url(), tried in order
+_RE_URL_EPISODE_NUMBERS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"episode[-_]?(\d+)",
+        r"episod(\d+)",
+        r"episdoe[-_]?(\d+)",
+        r"epidsode[-_]?(\d+)",
+        r"episoe[-_]?(\d+)",
+    )
+]
+_RE_PAGE_EPISODE_NUMBER = re.compile(r"Episode\s+(\d+)", re.IGNORECASE)
+_RE_EPISODE_NUMBER_DIV_CLASSES = [
+    re.compile(cls) for cls in ("episode", "content", "sqs-block")
+]
+_RE_SOUNDCLOUD_PLAYER = re.compile(r"soundcloud\.com/player")
+_RE_SOUNDCLOUD_TRACK = re.compile(r"api\.soundcloud\.com/tracks/([0-9]+)")
+_RE_ARCHIVE_EMBED = re.compile(r"archive\.org/embed")
+_RE_ARCHIVE_ID = re.compile(r"archive\.org/embed/([^/\?]+)")
+_RE_SOUNDCLOUD_BLOCK = re.compile("soundcloud-block")
+_RE_HTML_BLOCK = re.compile("html-block")
+_RE_PRE_WRAP = re.compile(r"white-space:\s*pre-wrap")
+_RE_DIGITS = re.compile(r"\d+")
+
+# Start time of the most recent request (time.monotonic()), shared by workers
+_last_request = 0.0
+_request_lock = threading.Lock()
+
+# Shared session: keeps connections to the site alive across pages, up to
+# one pooled connection per worker, and retries failures with backoff.
+_session = requests.Session()
+_session.headers["User-Agent"] = USER_AGENT
+_session.mount("https://", HTTPAdapter(
+    pool_maxsize=MAX_SCRAPE_WORKERS,
+    max_retries=Retry(
+        total=REQUEST_RETRIES,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+))
+
+# Called from several sort keys on the same (bounded) set of site URLs
+@cache
 def _get_episode_number_from_url(url: str) -> int | None:
     """Extracts the episode number from a URL.
 
     Handles standard (episode-123), no-dash (episode123), and common
     typos (episod123, episdoe-123, epidsode-123, episoe-123).
     """
-    patterns = [
-        r"episode[-_]?(\d+)",
-        r"episod(\d+)",
-        r"episdoe[-_]?(\d+)",
-        r"epidsode[-_]?(\d+)",
-        r"episoe[-_]?(\d+)",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url, re.IGNORECASE)
+    for pattern in _RE_URL_EPISODE_NUMBERS:
+        match = pattern.search(url)
         if match:
             return int(match.group(1))
     return None
@@ -42,54 +111,105 @@ def _get_episode_number_from_url(url: str) -> int | None:
 def read_latest_episode_info() -> str | None:
     """Reads the URL of the last scraped episode from the info file."""
     try:
-        with open(LATEST_EPISODE_INFO_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(LATEST_EPISODE_INFO_FILE, "rb") as f:
+            data = orjson.loads(f.read())
             return data.get("latest_episode_url")
-    except (FileNotFoundError, json.JSONDecodeError):
+    except (FileNotFoundError, orjson.JSONDecodeError):
         return None
 
 def write_latest_episode_info(latest_episode_url: str):
     """Writes the URL of the latest scraped episode to the info file."""
-    with open(LATEST_EPISODE_INFO_FILE, "w", encoding="utf-8") as f:
-        json.dump({"latest_episode_url": latest_episode_url}, f, indent=2)
+    with open(LATEST_EPISODE_INFO_FILE, "wb") as f:
+        f.write(orjson.dumps(
+            {"latest_episode_url": latest_episode_url},
+            option=orjson.OPT_INDENT_2,
+        ))
 
 
-def get_soup(url: str, retries: int = 3) -> BeautifulSoup | None:
-    """Fetch URL and return BeautifulSoup object."""
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-    }
-    for attempt in range(retries):
-        try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, "html.parser")
-        except requests.RequestException as e:
-            print(f"Attempt {attempt + 1} failed for {url}: {e}")
-            if attempt < retries - 1:
-                time.sleep(2**attempt)
-    return None
+def _throttle(delay: float) -> None:
+    """Wait until delay seconds have passed since the previous request started.
+
+    Thread-safe: concurrent workers start requests at most once per delay,
+    while their responses are still allowed to overlap.
+    """
+    global _last_request
+    with _request_lock:
+        wait = _last_request + delay - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _last_request = time.monotonic()
+
+
+def get_soup(
+    url: str,
+    delay: float = 0.0,
+    strainer: SoupStrainer | None = None,
+) -> BeautifulSoup | None:
+    """Fetch URL and return BeautifulSoup object.
+
+    Retries are handled by the shared session. With a delay, the request
+    is throttled via _throttle(). A strainer limits which parts of the
+    page are parsed.
+    """
+    content = _fetch(url, delay)
+    if content is None:
+        return None
+    # Raw bytes let lxml detect the encoding itself
+    return BeautifulSoup(content, "lxml", parse_only=strainer)
+
+
+def _fetch(url: str, delay: float = 0.0) -> bytes | None:
+    """Fetch URL and return the response body, or None on failure."""
+    if delay:
+        _throttle(delay)
+    try:
+        response = _session.get(url, timeout=30)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"Failed to fetch {url}: {e}")
+        return None
+    return response.content
+
+
+def fetch_episode_links(url: str, delay: float = 0.0) -> list[str]:
+    """Fetch a range page and return its episode URLs, sorted by number."""
+    content = _fetch(url, delay)
+    if content is None:
+        return []
+    try:
+        tree = lxml.html.fromstring(content)
+    except etree.ParserError:
+        # Empty or whitespace-only body
+        return []
+    return _sort_episode_links(_XPATH_EPISODE_LINKS(tree))
 
 
 def extract_episode_links(soup: BeautifulSoup) -> list[str]:
     """Extract all episode URLs from a page and sort by episode number."""
-    episode_urls_with_numbers = []
-    other_urls = []
-
+    hrefs = []
     for article in soup.find_all("article", class_="masonry-item"):
         a_tag = article.find("a", class_="masonry-link")
         if a_tag:
-            href = a_tag.get("href")
-            if href:
-                full_url = urljoin(BASE_URL, href)
-                episode_number = _get_episode_number_from_url(full_url)
-                if episode_number is not None:
-                    episode_urls_with_numbers.append((episode_number, full_url))
-                # Keep other valid episode-like URLs that might not have a clear number
-                # but are part of the main site content, e.g., special mixes,
-                # ensuring they don't get sorted by non-existent numbers.
-                elif "/episode-" in full_url or full_url.startswith(BASE_URL):
-                    other_urls.append(full_url)
+            hrefs.append(a_tag.get("href"))
+    return _sort_episode_links(hrefs)
+
+
+def _sort_episode_links(hrefs: Iterable[str | None]) -> list[str]:
+    """Resolve episode hrefs and order them by episode number, newest first."""
+    episode_urls_with_numbers = []
+    other_urls = []
+
+    for href in hrefs:
+        if href:
+            full_url = urljoin(BASE_URL, href)
+            episode_number = _get_episode_number_from_url(full_url)
+            if episode_number is not None:
+                episode_urls_with_numbers.append((episode_number, full_url))
+            # Keep other valid episode-like URLs that might not have a clear number
+            # but are part of the main site content, e.g., special mixes,
+            # ensuring they don't get sorted by non-existent numbers.
+            elif "/episode-" in full_url or full_url.startswith(BASE_URL):
+                other_urls.append(full_url)
 
     # Sort episodes by number in descending order
     episode_urls_with_numbers.sort(key=lambda x: x[0], reverse=True)
@@ -131,25 +251,72 @@ def _extract_episode_number_from_page(soup: BeautifulSoup) -> int | None:
     """Extract episode number from page content (title, headings, body text)."""
     title_tag = soup.find("title")
     if title_tag:
-        match = re.search(r"Episode\s+(\d+)", title_tag.get_text(), re.IGNORECASE)
+        match = _RE_PAGE_EPISODE_NUMBER.search(title_tag.get_text())
         if match:
             return int(match.group(1))
 
     for tag_name in ("h1", "h2", "h3"):
         for tag in soup.find_all(tag_name):
-            match = re.search(r"Episode\s+(\d+)", tag.get_text(), re.IGNORECASE)
+            match = _RE_PAGE_EPISODE_NUMBER.search(tag.get_text())
             if match:
                 return int(match.group(1))
 
-    for cls in ("episode", "content", "sqs-block"):
-        for div in soup.find_all("div", class_=re.compile(cls)):
-            match = re.search(r"Episode\s+(\d+)", div.get_text(), re.IGNORECASE)
+    for cls in _RE_EPISODE_NUMBER_DIV_CLASSES:
+        for div in soup.find_all("div", class_=cls):
+            match = _RE_PAGE_EPISODE_NUMBER.search(div.get_text())
             if match:
                 return int(match.group(1))
 
     return None
 
 
+def _paragraph_spans(block: Tag) -> Iterator[tuple[Tag, list[Tag]]]:
+    """Yield each <p> in block with the <span>s inside it, from one tree walk.
+
+    lxml never nests paragraphs, so a paragraph's spans follow it directly
+    in document order; spans outside any paragraph are skipped.
+    """
+    paragraph = None
+    spans: list[Tag] = []
+    for element in block.find_all(["p", "span"]):
+        if element.name == "p":
+            if paragraph is not None:
+                yield paragraph, spans
+            paragraph, spans = element, []
+        elif paragraph is not None and element.find_parent("p") is paragraph:
+            spans.append(element)
+    if paragraph is not None:
+        yield paragraph, spans
+
+
+def _tracks_from_spans(spans: list[Tag], tracklist: list[dict[str, str]]) -> bool:
+    """Append each "track - artist" line in spans; return True if any matched."""
+    append = tracklist.append
+    found = False
+    for span in spans:
+        for line in span.get_text(separator="\n", strip=True).split("\n"):
+            if " - " in line:
+                track, artist = line.split(" - ", 1)
+                track = track.strip()
+                artist = artist.strip()
+                if track and artist:
+                    append({"track": track, "artist": artist})
+                    found = True
+    return found
+
+
+def _track_from_pre_wrap(p: Tag, tracklist: list[dict[str, str]]) -> bool:
+    """Append the "track - artist" text of a pre-wrap paragraph, if it has one."""
+    if not _RE_PRE_WRAP.search(p.get("style", "")):
+        return False
+    text = p.get_text(strip=True)
+    if " - " not in text:
+        return False
+    track, artist = text.split(" - ", 1)
+    tracklist.append({"track": track.strip(), "artist": artist.strip()})
+    return True
+
+
 def extract_episode_data(url: str, soup: BeautifulSoup) -> dict[str, Any]:
     """Extract thumbnail, audio URL, and tracklist from episode page."""
     data = {
@@ -169,11 +336,11 @@ def extract_episode_data(url: str, soup: BeautifulSoup) -> dict[str, Any]:
             data["thumbnail"] = img.get("data-src") or img.get("src")
 
     # Extract Soundcloud URL from iframe
-    soundcloud_iframe = soup.find("iframe", src=re.compile(r"soundcloud\.com/player"))
+    soundcloud_iframe = soup.find("iframe", src=_RE_SOUNDCLOUD_PLAYER)
     if soundcloud_iframe:
         src = unquote(soundcloud_iframe.get("src", ""))
         # Try the api.soundcloud.com/tracks/{id} URL from the embed params
-        match = re.search(r"api\.soundcloud\.com/tracks/([0-9]+)", src)
+        match = _RE_SOUNDCLOUD_TRACK.search(src)
         if match:
             track_id = match.group(1)
             data["audio_url"] = (
@@ -190,10 +357,10 @@ def extract_episode_data(url: str, soup: BeautifulSoup) -> dict[str, Any]:
 
     # Extract Archive.org URL (for older episodes)
     if not data["audio_url"]:
-        archive_iframe = soup.find("iframe", src=re.compile(r"archive\.org/embed"))
+        archive_iframe = soup.find("iframe", src=_RE_ARCHIVE_EMBED)
         if archive_iframe:
             src = archive_iframe.get("src", "")
-            match = re.search(r"archive\.org/embed/([^/\?]+)", src)
+            match = _RE_ARCHIVE_ID.search(src)
             if match:
                 archive_id = match.group(1)
                 data["audio_url"] = f"https://archive.org/details/{archive_id}"
@@ -205,38 +372,24 @@ def extract_episode_data(url: str, soup: BeautifulSoup) -> dict[str, Any]:
     # Format: "tracktitle - artist"
 
     # Try finding tracklist after soundcloud block first
-    soundcloud_block = soup.find("div", class_=re.compile("soundcloud-block"))
+    soundcloud_block = soup.find("div", class_=_RE_SOUNDCLOUD_BLOCK)
 
     # If no soundcloud block, try html block
     if not soundcloud_block:
-        soundcloud_block = soup.find("div", class_=re.compile("html-block"))
+        soundcloud_block = soup.find("div", class_=_RE_HTML_BLOCK)
 
     if soundcloud_block:
+        tracklist = data["tracklist"]
+
         # First check the block itself for tracklist (old format)
         # Format: <p><span>track - artist<br>...
-        if not data["tracklist"]:
-            all_paras = soundcloud_block.find_all("p")
-            for p in all_paras:
-                spans = p.find_all("span")
-                for span in spans:
-                    text_content = span.get_text(separator="\n", strip=True)
-                    if text_content:
-                        lines = text_content.split("\n")
-                        for line in lines:
-                            line = line.strip()
-                            if line and " - " in line:
-                                parts = line.split(" - ", 1)
-                                if len(parts) == 2:
-                                    track = parts[0].strip()
-                                    artist = parts[1].strip()
-                                    if track and artist:
-                                        data["tracklist"].append(
-                                            {"track": track, "artist": artist}
-                                        )
+        for _, spans in _paragraph_spans(soundcloud_block):
+            _tracks_from_spans(spans, tracklist)
 
         # Then check siblings for tracklist (new format)
+        misses = 0
         current = soundcloud_block.find_next_sibling()
-        while current:
+        while current and misses < TRACKLIST_MAX_MISSES:
             # Stop at certain block types that indicate end of tracklist
             if current.name == "div" and current.get("class"):
                 block_class = " ".join(current.get("class", []))
@@ -247,73 +400,149 @@ def extract_episode_data(url: str, soup: BeautifulSoup) -> dict[str, Any]:
                     break
 
             if current.name == "div":
-                # Format 1: <p style="white-space:pre-wrap;">
-                paras = current.find_all(
-                    "p", style=re.compile(r"white-space:\s*pre-wrap")
-                )
-                for p in paras:
-                    text = p.get_text(strip=True)
-                    if text and " - " in text:
-                        parts = text.split(" - ", 1)
-                        if len(parts) == 2:
-                            data["tracklist"].append(
-                                {"track": parts[0].strip(), "artist": parts[1].strip()}
-                            )
-
-                # Format 2: <p><span>track - artist<br> (older episodes)
-                paras = current.find_all("p")
-                for p in paras:
-                    spans = p.find_all("span")
-                    for span in spans:
-                        text_content = span.get_text(separator="\n", strip=True)
-                        if text_content:
-                            lines = text_content.split("\n")
-                            for line in lines:
-                                line = line.strip()
-                                if line and " - " in line:
-                                    parts = line.split(" - ", 1)
-                                    if len(parts) == 2:
-                                        track = parts[0].strip()
-                                        artist = parts[1].strip()
-                                        if track and artist:
-                                            data["tracklist"].append(
-                                                {"track": track, "artist": artist}
-                                            )
+                had_tracks = bool(tracklist)
+                block_found = False
+                # Each paragraph is read in exactly one format so a pre-wrap
+                # <p> holding spans isn't listed twice
+                for p, spans in _paragraph_spans(current):
+                    # Format 2: <p><span>track - artist<br> (older episodes)
+                    found = _tracks_from_spans(spans, tracklist)
+                    # Format 1: <p style="white-space:pre-wrap;">
+                    if not found:
+                        found = _track_from_pre_wrap(p, tracklist)
+                    block_found = block_found or found
+
+                if block_found:
+                    misses = 0
+                elif had_tracks and current.get_text(strip=True):
+                    # Credits and other blocks follow the tracklist; stop
+                    # once several blocks in a row hold no tracks
+                    misses += 1
             current = current.find_next_sibling()
 
     return data
 
 
-def scrape_episodes(episode_urls: list[str], delay: float = DEFAULT_REQUEST_DELAY) -> list[dict[str, Any]]:
-    """Scrape all episode pages."""
-    episodes = []
+def _scrape_episode(url: str, delay: float) -> dict[str, Any] | None:
+    """Fetch and extract a single episode page."""
+    soup = get_soup(url, delay=delay, strainer=EPISODE_STRAINER)
+    if soup:
+        return extract_episode_data(url, soup)
+    return None
+
+
+def scrape_episodes(
+    episode_urls: list[str],
+    delay: float = DEFAULT_REQUEST_DELAY,
+    workers: int = SCRAPE_WORKERS,
+) -> list[dict[str, Any]]:
+    """Scrape all episode pages.
+
+    Pages are fetched by a pool of worker threads so that network latency
+    overlaps; request starts are still spaced at least delay seconds apart.
+    Episodes are returned in the order of episode_urls.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(tqdm(
+            executor.map(lambda url: _scrape_episode(url, delay), episode_urls),
+            total=len(episode_urls),
+            desc="Scraping episodes",
+            unit="ep",
+            ncols=80,
+            leave=True,
+        ))
+
+    return [data for data in results if data]
+
 
-    for url in tqdm(episode_urls, desc="Scraping episodes", unit="ep", ncols=80, leave=True):
-        soup = get_soup(url)
-        if soup:
-            data = extract_episode_data(url, soup)
-            episodes.append(data)
-        time.sleep(delay)
+def _range_page_number(url: str) -> int | None:
+    """Largest number in a range page's path, used to order pages by age."""
+    numbers = _RE_DIGITS.findall(urlparse(url).path)
+    return max(map(int, numbers)) if numbers else None
 
-    return episodes
 
+def _reaches_episode(episode_urls: list[str], episode_num: int) -> bool:
+    """Check whether any of the URLs is for episode_num or an older one."""
+    for url in episode_urls:
+        number = _get_episode_number_from_url(url)
+        if number is not None and number <= episode_num:
+            return True
+    return False
 
-def collect_all_episode_urls(homepage_soup: BeautifulSoup) -> set[str]:
-    """Collect all episode URLs from homepage and range pages."""
+
+def _covers_new_episodes(episode_urls: list[str], episode_num: int) -> bool:
+    """Check whether the URLs list every episode after episode_num.
+
+    That is each number from episode_num + 1 up to the newest one listed,
+    so an older episode featured among newer ones doesn't count as a gap.
+    """
+    numbers = {_get_episode_number_from_url(url) for url in episode_urls}
+    numbers.discard(None)
+    if not numbers:
+        return False
+    return numbers.issuperset(range(episode_num + 1, max(numbers) + 1))
+
+
+def collect_all_episode_urls(
+    homepage_soup: BeautifulSoup,
+    previous_episode_num: int | None = None,
+    workers: int = SCRAPE_WORKERS,
+) -> set[str]:
+    """Collect all episode URLs from homepage and range pages.
+
+    With previous_episode_num (an incremental run), range pages are only
+    fetched until one reaches that episode: if the homepage already lists
+    every episode since then, none are fetched; otherwise pages are
+    visited newest first, a worker pool's worth at a time, since every
+    later page is older still.
+    """
     all_episode_urls: set[str] = set()
 
     homepage_episode_links = extract_episode_links(homepage_soup)
     all_episode_urls.update(homepage_episode_links)
 
+    if previous_episode_num is not None and _covers_new_episodes(
+        homepage_episode_links, previous_episode_num
+    ):
+        print("\nAll new episodes are on the homepage; skipping range pages.")
+        return all_episode_urls
+
     print("\nFetching episode range pages...")
     range_urls = get_episode_range_urls(homepage_soup)
 
-    for range_url in tqdm(range_urls, desc="Fetching range pages", unit="page", ncols=80, leave=True):
-        soup = get_soup(range_url)
-        if soup:
-            episode_urls = extract_episode_links(soup)
-            all_episode_urls.update(episode_urls)
-        time.sleep(DEFAULT_REQUEST_DELAY)
+    # Pages can only be cut off early when their age order is known
+    wave_size = len(range_urls) or 1
+    if previous_episode_num is not None and all(
+        _range_page_number(url) is not None for url in range_urls
+    ):
+        range_urls.sort(key=_range_page_number, reverse=True)
+        wave_size = workers
+
+    def fetch_links(range_url: str) -> list[str]:
+        return fetch_episode_links(range_url, delay=DEFAULT_REQUEST_DELAY)
+
+    with (
+        ThreadPoolExecutor(max_workers=workers) as executor,
+        tqdm(
+            total=len(range_urls),
+            desc="Fetching range pages",
+            unit="page",
+            ncols=80,
+            leave=True,
+        ) as pbar,
+    ):
+        for start in range(0, len(range_urls), wave_size):
+            caught_up = False
+            wave = range_urls[start:start + wave_size]
+            for episode_urls in executor.map(fetch_links, wave):
+                pbar.update()
+                all_episode_urls.update(episode_urls)
+                if previous_episode_num is not None and _reaches_episode(
+                    episode_urls, previous_episode_num
+                ):
+                    caught_up = True
+            if caught_up:
+                break
 
     return all_episode_urls
 
@@ -324,24 +553,26 @@ def filter_new_episodes(
     current_latest_url: str,
 ) -> list[str]:
     """Filter URLs to find episodes that need scraping."""
-    sorted_urls = sorted(
-        all_urls,
-        key=lambda url: _get_episode_number_from_url(url) or 0,
+    # Look each number up once; unnumbered URLs (special mixes) sort last
+    numbered_urls = sorted(
+        ((_get_episode_number_from_url(url), url) for url in all_urls),
+        key=lambda pair: pair[0] or 0,
         reverse=True,
     )
 
-    if not previously_stored_url:
-        return sorted_urls
-
-    previous_episode_num = _get_episode_number_from_url(previously_stored_url)
+    previous_episode_num = (
+        _get_episode_number_from_url(previously_stored_url)
+        if previously_stored_url
+        else None
+    )
     if previous_episode_num is None:
-        return sorted_urls
+        return [url for _, url in numbered_urls]
 
-    new_episodes = []
-    for url in sorted_urls:
-        episode_num = _get_episode_number_from_url(url)
-        if episode_num is not None and episode_num > previous_episode_num:
-            new_episodes.append(url)
+    new_episodes = [
+        url
+        for episode_num, url in numbered_urls
+        if episode_num is not None and episode_num > previous_episode_num
+    ]
 
     print(f"Found {len(new_episodes)} new episodes to scrape.")
     return new_episodes
@@ -350,9 +581,9 @@ def filter_new_episodes(
 def load_existing_episodes() -> list[dict[str, Any]]:
     """Load existing episodes from JSON file."""
     try:
-        with open(OUTPUT_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open(OUTPUT_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
         print(f"No existing {OUTPUT_FILE} found. Starting fresh.")
         return []
 
@@ -371,8 +602,8 @@ def save_episodes(existing: list[dict[str, Any]], new: list[dict[str, Any]]) ->
         reverse=True,
     )
 
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(final, f, indent=2, ensure_ascii=False)
+    with open(OUTPUT_FILE, "wb") as f:
+        f.write(orjson.dumps(final, option=orjson.OPT_INDENT_2))
 
     print(f"\nSaved {len(new)} new episodes. Total {len(final)} to {OUTPUT_FILE}")
 
@@ -385,10 +616,26 @@ def main() -> None:
         default=0,
         help="Limit number of episodes to scrape (0 = no limit)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SCRAPE_WORKERS,
+        choices=range(1, MAX_SCRAPE_WORKERS + 1),
+        metavar=f"1-{MAX_SCRAPE_WORKERS}",
+        help=(
+            f"Pages fetched concurrently (default {SCRAPE_WORKERS}); requests "
+            f"still start at most every {DEFAULT_REQUEST_DELAY}s"
+        ),
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rescrape every episode, ignoring the stored latest episode",
+    )
     args = parser.parse_args()
 
     print(f"Fetching homepage: {BASE_URL}")
-    homepage_soup = get_soup(BASE_URL)
+    homepage_soup = get_soup(BASE_URL, strainer=HOMEPAGE_STRAINER)
     if not homepage_soup:
         print("Failed to fetch homepage. Exiting.")
         return
@@ -401,16 +648,26 @@ def main() -> None:
     current_latest_url = homepage_episode_links[0]
     print(f"Latest episode on site: {current_latest_url}")
 
-    previously_stored_url = read_latest_episode_info()
+    previously_stored_url = None if args.full else read_latest_episode_info()
 
     if previously_stored_url == current_latest_url:
         print("No new episodes found. Exiting.")
         return
 
-    print("New episode(s) found! Starting scrape.")
+    if args.full:
+        print("Full rescrape requested. Starting scrape.")
+    else:
+        print("New episode(s) found! Starting scrape.")
     write_latest_episode_info(current_latest_url)
 
-    all_episode_urls = collect_all_episode_urls(homepage_soup)
+    previous_episode_num = (
+        _get_episode_number_from_url(previously_stored_url)
+        if previously_stored_url
+        else None
+    )
+    all_episode_urls = collect_all_episode_urls(
+        homepage_soup, previous_episode_num, workers=args.workers
+    )
     episodes_to_scrape = filter_new_episodes(
         all_episode_urls, previously_stored_url, current_latest_url
     )
@@ -423,7 +680,7 @@ def main() -> None:
         print("No new episodes to scrape.")
         return
 
-    episodes = scrape_episodes(episodes_to_scrape)
+    episodes = scrape_episodes(episodes_to_scrape, workers=args.workers)
     existing = load_existing_episodes()
     save_episodes(existing, episodes)
 
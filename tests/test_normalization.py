@@ -0,0 +1,58 @@
+import random
+import unicodedata
+
+import pytest
+
+from normalization import normalize
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Björk", "bjork"),
+        ("Sigur Rós", "sigur ros"),
+        ("AC/DC", "ac dc"),
+        ("Simon & Garfunkel", "simon and garfunkel"),
+        ("Song (Remix)", "song"),
+        ("Μπουζούκι", "μπουζουκι"),
+        ("ℌello", "hello"),
+        # Marks are part of the letter outside Latin, Greek and Cyrillic
+        ("ジブリ", "ジブリ"),
+        ("हिन्दी", "हिन्दी"),
+        ("坂本龍一", "坂本龍一"),
+        # Emoji selectors and marks on blanked symbols go with their base
+        ("Song ❤️", "song"),
+        ("1️⃣ Thing", "1 thing"),
+        ("★́ Star", "star"),
+    ],
+)
+def test_normalize(text, expected):
+    assert normalize(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Song ❤️",
+        "★́ Star",
+        "　́x",
+        "ᬞͅॎ",  # Casefold turns the mark into a Greek letter
+        "Ↄৢ",  # Roman numeral that lowercases to a Latin letter
+        "Ǆ İstanbul ﬁve",
+    ],
+)
+def test_normalize_is_idempotent(text):
+    once = normalize(text)
+    assert normalize(once) == once
+
+
+def test_normalize_is_idempotent_on_random_text():
+    rng = random.Random(7)
+    alphabet = [
+        c for c in map(chr, range(0x20, 0x3000))
+        if unicodedata.category(c) != "Cs"
+    ] + ["️", "⃣", "‍", "́", "゙", "❤", "★"]
+    for _ in range(20000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 8)))
+        once = normalize(text)
+        assert normalize(once) == once, text
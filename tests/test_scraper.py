@@ -0,0 +1,193 @@
+import threading
+
+import pytest
+from bs4 import BeautifulSoup
+
+import scraper
+
+BASE = scraper.BASE_URL
+PRE_WRAP = '<p style="white-space:pre-wrap;">{}</p>'
+
+
+def article(number):
+    return (
+        '<article class="masonry-item">'
+        f'<a class="masonry-link" href="/episode-{number}">Episode {number}</a>'
+        "</article>"
+    )
+
+
+# 20 range pages of ten episodes each (1-10 ... 191-200); the homepage
+# lists the five newest episodes, 201-205
+RANGE_PAGES = {
+    f"{BASE}/episodes-{first}-{first + 9}": list(range(first, first + 10))
+    for first in range(1, 200, 10)
+}
+
+
+def homepage(numbers=range(201, 206)):
+    nav = "".join(f'<a href="{url[len(BASE):]}">Range</a>' for url in RANGE_PAGES)
+    html = (
+        '<ul><li class="folder-collection folder"><a>RADIO SHOWS</a>'
+        f'<div class="folder-child">{nav}</div></li></ul>'
+        + "".join(article(n) for n in numbers)
+    )
+    return BeautifulSoup(html, "lxml", parse_only=scraper.HOMEPAGE_STRAINER)
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    """Serve RANGE_PAGES without the network and record which were fetched."""
+    urls = []
+    lock = threading.Lock()
+
+    def fake_fetch_episode_links(url, delay=0.0):
+        with lock:
+            urls.append(url)
+        return [f"{BASE}/episode-{n}" for n in reversed(RANGE_PAGES[url])]
+
+    monkeypatch.setattr(scraper, "fetch_episode_links", fake_fetch_episode_links)
+    return urls
+
+
+@pytest.mark.parametrize(
+    ("previous", "pages_fetched", "new_episodes"),
+    [
+        (None, 20, 205),  # First run: every page
+        (0, 20, 205),  # Nothing stored yet reaches episode 0
+        (203, 0, 2),  # The homepage covers 204 and 205
+        (195, 8, 10),  # The first wave holds 191-200
+        (150, 8, 55),  # ...and 121-200
+    ],
+)
+def test_collect_all_episode_urls_stops_early(
+    fetched, previous, pages_fetched, new_episodes
+):
+    urls = scraper.collect_all_episode_urls(homepage(), previous, workers=8)
+    previous_url = f"{BASE}/episode-{previous}" if previous is not None else None
+    new = scraper.filter_new_episodes(urls, previous_url, "")
+
+    assert len(fetched) == pages_fetched
+    assert len(new) == new_episodes
+    assert new == [f"{BASE}/episode-{n}" for n in range(205, 205 - new_episodes, -1)]
+
+
+def test_collect_all_episode_urls_fetches_newest_pages_first(fetched):
+    scraper.collect_all_episode_urls(homepage(), 185, workers=1)
+    assert fetched == [f"{BASE}/episodes-191-200", f"{BASE}/episodes-181-190"]
+
+
+def test_collect_all_episode_urls_fetches_pages_on_homepage_gap(fetched):
+    # 202 is missing from the homepage, so it has to come from a range page
+    urls = scraper.collect_all_episode_urls(homepage([201, 203, 204]), 200)
+    assert fetched
+    assert f"{BASE}/episode-200" in urls
+
+
+@pytest.mark.parametrize(
+    ("numbers", "previous", "expected"),
+    [
+        ([205, 204, 203], 202, True),
+        ([205, 204, 203], 201, False),
+        ([205, 203], 202, False),
+        # An older episode featured on the homepage isn't a gap
+        ([205, 204, 150], 203, True),
+        ([205], 205, True),
+        ([], 200, False),
+    ],
+)
+def test_covers_new_episodes(numbers, previous, expected):
+    urls = [f"{BASE}/episode-{n}" for n in numbers]
+    assert scraper._covers_new_episodes(urls, previous) is expected
+
+
+def test_fetch_episode_links(monkeypatch):
+    html = (
+        article(3)
+        + article(12)
+        + '<article class="masonry-item other">'
+        '<a class="masonry-link" href="/episode-7">7</a>'
+        '<a class="masonry-link" href="/episode-8">8</a></article>'
+        '<a class="masonry-link" href="/episode-99">Not in an article</a>'
+    )
+    monkeypatch.setattr(scraper, "_fetch", lambda url, delay=0.0: html.encode())
+
+    assert scraper.fetch_episode_links(f"{BASE}/episodes-1-20") == [
+        f"{BASE}/episode-12",
+        f"{BASE}/episode-7",
+        f"{BASE}/episode-3",
+    ]
+
+
+def test_fetch_episode_links_empty_body(monkeypatch):
+    monkeypatch.setattr(scraper, "_fetch", lambda url, delay=0.0: b"  ")
+    assert scraper.fetch_episode_links(f"{BASE}/episodes-1-20") == []
+
+
+def tracklist(*blocks, player=""):
+    """Tracks read from an episode page with the given blocks after the player."""
+    html = (
+        f'<html><body><div class="sqs-block soundcloud-block">{player}</div>'
+        + "".join(blocks)
+        + "</body></html>"
+    )
+    soup = BeautifulSoup(html.encode(), "lxml", parse_only=scraper.EPISODE_STRAINER)
+    data = scraper.extract_episode_data(f"{BASE}/episode-1", soup)
+    return [(t["track"], t["artist"]) for t in data["tracklist"]]
+
+
+def block(*paragraphs, cls="sqs-block html-block"):
+    return f'<div class="{cls}">{"".join(paragraphs)}</div>'
+
+
+def test_tracklist_pre_wrap():
+    assert tracklist(block(PRE_WRAP.format("A - B"), PRE_WRAP.format("C - D"))) == [
+        ("A", "B"),
+        ("C", "D"),
+    ]
+
+
+def test_tracklist_spans_in_player_block():
+    player = "<p><span>A - B<br>C - D<br>Thanks for listening</span></p>"
+    assert tracklist(player=player) == [("A", "B"), ("C", "D")]
+
+
+def test_tracklist_note_inside_block_does_not_stop():
+    assert tracklist(
+        block(
+            PRE_WRAP.format("A - B"),
+            "<p>Recorded live</p>",
+            "<p>Part two</p>",
+            "<p>Guest mix</p>",
+            PRE_WRAP.format("C - D"),
+        )
+    ) == [("A", "B"), ("C", "D")]
+
+
+def test_tracklist_headers_and_spacers_between_blocks():
+    assert tracklist(
+        block(PRE_WRAP.format("A - B")),
+        block("<p>Part two</p>"),
+        block(),
+        block(),
+        block("<p>Guest mix</p>"),
+        block(PRE_WRAP.format("C - D")),
+    ) == [("A", "B"), ("C", "D")]
+
+
+def test_tracklist_stops_after_trailing_blocks():
+    assert tracklist(
+        block(PRE_WRAP.format("A - B")),
+        block("<p>Artwork by someone</p>"),
+        block("<p>Subscribe</p>"),
+        block("<p>Share</p>"),
+        block(PRE_WRAP.format("Related - Episode")),
+    ) == [("A", "B")]
+
+
+def test_tracklist_stops_at_markdown_block():
+    assert tracklist(
+        block(PRE_WRAP.format("A - B")),
+        block("<p>Notes</p>", cls="sqs-block sqs-block-markdown"),
+        block(PRE_WRAP.format("C - D")),
+    ) == [("A", "B")]